@@ -3,12 +3,17 @@
 Main Description Agent for AutoGen Project Report Generator
 """
 import asyncio
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, AsyncIterator, List
 from dataclasses import dataclass
 # AutoGen imports
 from autogen_agentchat.agents import AssistantAgent
-from autogen_agentchat.messages import TextMessage
+from autogen_agentchat.messages import TextMessage, ModelClientStreamingChunkEvent
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_ext.models.anthropic import AnthropicChatCompletionClient
 from autogen_ext.models.ollama import OllamaChatCompletionClient
@@ -27,6 +32,7 @@ from tools.consultor_loader import load_consultor_persona
 from tools.document_extractor import extract_questioner_content
 from tools.cost_calculator import calculate_task_cost
 from tools.report_generator import create_technical_report, create_financial_report
+from tools.llm_cache import cached_call
 
 
 PROMPT = f"""
@@ -53,6 +59,27 @@ You have to generate technical and financial reports based on the given context.
 
 
 
+# Worker pool for rendering report files; docx serialization is
+# pure-Python CPU work, so separate processes let the per-model reports
+# render in parallel instead of serializing on the GIL (workers are
+# spawned lazily on first submit). Spawn explicitly: the first submit
+# happens on a Streamlit worker thread, and forking a multithreaded
+# server process is a deadlock hazard
+_REPORT_POOL = ProcessPoolExecutor(
+    max_workers=os.cpu_count(),
+    mp_context=multiprocessing.get_context("spawn")
+)
+
+
+# Splits a model response into its technical and financial halves in one
+# pass; the section markers and the financial half are both optional, and
+# leading whitespace before the technical marker is tolerated
+_PARSE_RESPONSE_RE = re.compile(
+    r"\s*(?:TECHNICAL ANALYSIS:)?\s*(?P<technical>.*?)(?:FINANCIAL ANALYSIS:(?P<financial>.*))?$",
+    re.DOTALL
+)
+
+
 @dataclass
 class ProjectData:
     """Data structure for project information"""
@@ -69,27 +96,69 @@ class ProjectData:
         if self.user_responses is None:
             self.user_responses = {}
 
+# The model clients and the search tool are stateless, so one lazily
+# built instance per process serves every DescriptionAgent - sessions
+# share connections without sharing any conversation state
+@lru_cache(maxsize=1)
+def _shared_openai_client() -> OpenAIChatCompletionClient:
+    return OpenAIChatCompletionClient(model="gpt-4o")
+
+@lru_cache(maxsize=1)
+def _shared_claude_client() -> AnthropicChatCompletionClient:
+    return AnthropicChatCompletionClient(model="claude-3-7-sonnet-latest")
+
+@lru_cache(maxsize=1)
+def _shared_llama_client() -> OllamaChatCompletionClient:
+    return OllamaChatCompletionClient(model="llama3.2")
+
+@lru_cache(maxsize=1)
+def _shared_search_tool() -> LangChainToolAdapter:
+    serper = GoogleSerperAPIWrapper()
+    langchain_serper =Tool(name="internet_search", func=serper.run, description="useful for when you need to search the internet")
+    return LangChainToolAdapter(langchain_serper)
+
+
 class DescriptionAgent:
     """Main agent that coordinates the entire system"""
-    
+
     def __init__(self):
         self.project_data = ProjectData()
         self.consultor_persona = load_consultor_persona()
-        
-        # Initialize model clients
-        self.openai_client = OpenAIChatCompletionClient(model="gpt-4o")
-        self.claude_client = AnthropicChatCompletionClient(model="claude-3-7-sonnet-latest")
-        self.llama_client = OllamaChatCompletionClient(model="llama3.2")
-        serper = GoogleSerperAPIWrapper()
-        langchain_serper =Tool(name="internet_search", func=serper.run, description="useful for when you need to search the internet")
-        self.google_serper = LangChainToolAdapter(langchain_serper)
-        
-        # Initialize specialized agents
-        self.chat_agent = self._create_chat_agent()
-        self.openai_agent = self._create_openai_agent()
-        self.claude_agent = self._create_claude_agent()
-        self.llama_agent = self._create_llama_agent()
-    
+
+    # Clients resolve to the shared process-wide instances; the agents are
+    # built lazily per DescriptionAgent since they hold conversation state
+    @property
+    def openai_client(self) -> OpenAIChatCompletionClient:
+        return _shared_openai_client()
+
+    @property
+    def claude_client(self) -> AnthropicChatCompletionClient:
+        return _shared_claude_client()
+
+    @property
+    def llama_client(self) -> OllamaChatCompletionClient:
+        return _shared_llama_client()
+
+    @property
+    def google_serper(self) -> LangChainToolAdapter:
+        return _shared_search_tool()
+
+    @cached_property
+    def chat_agent(self) -> AssistantAgent:
+        return self._create_chat_agent()
+
+    @cached_property
+    def openai_agent(self) -> AssistantAgent:
+        return self._create_openai_agent()
+
+    @cached_property
+    def claude_agent(self) -> AssistantAgent:
+        return self._create_claude_agent()
+
+    @cached_property
+    def llama_agent(self) -> AssistantAgent:
+        return self._create_llama_agent()
+
     def _create_chat_agent(self) -> AssistantAgent:
         """Create the main conversation agent"""
 
@@ -157,56 +226,93 @@ Always ask one question at a time and wait for the user's response before moving
             reflect_on_tool_use=True
         )
     
+    def _build_chat_context(self, user_message: str, questioner_content: Dict[str, Any]) -> str:
+        """Build the chat agent context for a user message"""
+        return f"""
+Questioner Document Sections:
+{chr(10).join(f"{i+1}. {section['title']}" for i, section in enumerate(questioner_content['sections']))}
+
+User Message: {user_message}
+
+Please start asking questions from the questioner document systematically, one section at a time.
+        """
+
     async def start_conversation(self, user_message: str) -> str:
         """Start the conversation with the user"""
         # Extract questioner content
         questioner_content = extract_questioner_content()
-        
+
         if "error" in questioner_content:
             return f"Error: {questioner_content['error']}"
-        
-        # Create context for the chat agent
-        context = f"""
-Questioner Document Sections:
-{chr(10).join(f"{i+1}. {section['title']}" for i, section in enumerate(questioner_content['sections']))}
 
-User Message: {user_message}
+        # Create context for the chat agent. Chat turns are never served
+        # from the response cache: the reply depends on the conversation so
+        # far, which the cache key can't see
+        context = self._build_chat_context(user_message, questioner_content)
 
-Please start asking questions from the questioner document systematically, one section at a time.
-        """
-        
         message = TextMessage(content=context, source="user")
         response = await self.chat_agent.on_messages([message], cancellation_token=CancellationToken())
-        
+
         return response.chat_message.content
+
+    async def start_conversation_stream(self, user_message: str) -> AsyncIterator[str]:
+        """Stream the conversation response chunk by chunk as it is generated"""
+        questioner_content = extract_questioner_content()
+
+        if "error" in questioner_content:
+            yield f"Error: {questioner_content['error']}"
+            return
+
+        context = self._build_chat_context(user_message, questioner_content)
+
+        message = TextMessage(content=context, source="user")
+        async for event in self.chat_agent.on_messages_stream([message], cancellation_token=CancellationToken()):
+            if isinstance(event, ModelClientStreamingChunkEvent):
+                yield event.content
+
+    async def reset_chat(self) -> None:
+        """Clear the chat agent's conversation context for a fresh start"""
+        await self.chat_agent.on_reset(CancellationToken())
     
     async def generate_reports(self,messages) -> Dict[str, Any]:
         """Generate reports using all three models"""
         results = {}
-        context = f""""""
-        for message in messages:
-            context += f"""<{message['role'] } said> : \n{message['content']}\n\n"""
+        context = "".join(
+            f"""<{message['role'] } said> : \n{message['content']}\n\n""" for message in messages
+        )
 
 
 
         # Prepare context for report generation
         # context = self._prepare_report_context()
-        
+
         # Generate reports with each model
         models = {
             "openai": self.openai_agent,
             "claude": self.claude_agent,
             # "llama": self.llama_agent
         }
-        
-        for model_name, agent in models.items():
-            try:
-                result = await self._generate_model_reports(agent, model_name, context)
-                results[model_name] = result
-            except Exception as e:
-                results[model_name] = {"error": str(e)}
-        
+
+        # Run all models concurrently - the calls are independent I/O so total
+        # latency is max(model latency) instead of the sum
+        model_results = await asyncio.gather(
+            *[
+                self._generate_model_reports_safe(agent, model_name, context)
+                for model_name, agent in models.items()
+            ]
+        )
+
+        for model_name, result in zip(models.keys(), model_results):
+            results[model_name] = result
+
         return results
+
+    async def _generate_model_reports_safe(self, agent: AssistantAgent, model_name: str, context: str) -> Dict[str, Any]:
+        """Generate reports for a model, returning an error dict instead of raising"""
+        try:
+            return await self._generate_model_reports(agent, model_name, context)
+        except Exception as e:
+            return {"error": str(e)}
     
     def _prepare_report_context(self) -> str:
         """Prepare context for report generation"""
@@ -225,21 +331,28 @@ Please generate both a technical report and a financial report based on this inf
     
     async def _generate_model_reports(self, agent: AssistantAgent, model_name: str, context: str) -> Dict[str, Any]:
         """Generate reports for a specific model"""
+        # The transcript context comes first so regenerations share a stable
+        # prefix and hit the providers' server-side prompt caches
         context = context + PROMPT
 
-        message = TextMessage(content=context, source="user")
-        response = await agent.on_messages([message], cancellation_token=CancellationToken())
-        
+        response_text = await cached_call(agent, context)
+
         # Parse the response to extract technical and financial analysis
-        analysis = self._parse_model_response(response.chat_message.content)
-        
-        # Generate reports
-        technical_report_path = create_technical_report(
-            self.project_data.__dict__, model_name, analysis.get("technical", "")
-        )
-        
-        financial_report_path = create_financial_report(
-            self.project_data.__dict__, model_name, analysis.get("financial", ""), {}
+        analysis = self._parse_model_response(response_text)
+
+        # Generate reports in the process pool so the CPU-bound docx
+        # rendering runs on separate cores and overlaps with other models'
+        # in-flight LLM calls
+        loop = asyncio.get_running_loop()
+        technical_report_path, financial_report_path = await asyncio.gather(
+            loop.run_in_executor(
+                _REPORT_POOL, create_technical_report,
+                self.project_data.__dict__, model_name, analysis.get("technical", "")
+            ),
+            loop.run_in_executor(
+                _REPORT_POOL, create_financial_report,
+                self.project_data.__dict__, model_name, analysis.get("financial", ""), {}
+            )
         )
         
         return {
@@ -250,16 +363,9 @@ Please generate both a technical report and a financial report based on this inf
     
     def _parse_model_response(self, response: str) -> Dict[str, str]:
         """Parse model response to extract technical and financial analysis"""
-        parts = response.split("FINANCIAL ANALYSIS:")
-        
-        if len(parts) >= 2:
-            technical = parts[0].replace("TECHNICAL ANALYSIS:", "").strip()
-            financial = parts[1].strip()
-        else:
-            technical = response
-            financial = ""
-        
+        match = _PARSE_RESPONSE_RE.match(response)
+
         return {
-            "technical": technical,
-            "financial": financial
+            "technical": (match["technical"] or "").strip(),
+            "financial": (match["financial"] or "").strip()
         }
\ No newline at end of file
@@ -6,6 +6,7 @@ import asyncio
 from pathlib import Path
 
 from agents.description_agent import DescriptionAgent
+
 def main():
     st.set_page_config(
         page_title="NGEN Project Report Generator",
@@ -16,10 +17,13 @@ def main():
     st.title("🤖 NGEN Consultor")
     st.markdown("Generate technical and financial reports using multiple AI models")
     
-    # Initialize session state
+    # Initialize session state. The agent stays per-session because its
+    # chat agent accumulates the conversation; the model clients inside it
+    # are shared process-wide (see agents/description_agent.py)
     if "agent" not in st.session_state:
         st.session_state.agent = DescriptionAgent()
-    
+    agent = st.session_state.agent
+
     if "messages" not in st.session_state:
         st.session_state.messages = []
     
@@ -30,6 +34,8 @@ def main():
         
         if st.button("🔄 Reset Conversation"):
             st.session_state.messages = []
+            # The chat agent keeps its own history, so reset that too
+            asyncio.run(agent.reset_chat())
             st.rerun()
     
     # Main chat interface
@@ -49,19 +55,26 @@ def main():
         with st.chat_message("user"):
             st.markdown(prompt)
         
-        # Get agent response
+        # Get agent response, rendering tokens as they stream in
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                response = asyncio.run(st.session_state.agent.start_conversation(prompt))
-                st.markdown(response)
-                st.session_state.messages.append({"role": "assistant", "content": response})
+            placeholder = st.empty()
+
+            async def render() -> str:
+                accumulated = ""
+                async for chunk in agent.start_conversation_stream(prompt):
+                    accumulated += chunk
+                    placeholder.markdown(accumulated)
+                return accumulated
+
+            response = asyncio.run(render())
+            st.session_state.messages.append({"role": "assistant", "content": response})
     
     # Report generation section
     st.header("📊 Generate Reports")
     
     if st.button("🚀 Generate Reports with All Models"):
         with st.spinner("Generating reports..."):
-            results = asyncio.run(st.session_state.agent.generate_reports(st.session_state.messages))
+            results = asyncio.run(agent.generate_reports(st.session_state.messages))
             
             # Display results
             for model_name, result in results.items():
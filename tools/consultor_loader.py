@@ -1,13 +1,20 @@
 """
 Tool to load the consultor/interviewer persona from a text file.
 """
+from functools import lru_cache
 from pathlib import Path
 
 def load_consultor_persona(filepath: str = "data/interviewer.txt") -> str:
     """
     Load the consultor persona from the given file and return as text.
+    Reads are cached and invalidated when the file changes on disk.
     """
     path = Path(filepath)
     if not path.exists():
         return "[Consultor persona not found]"
-    return path.read_text(encoding="utf-8").strip() 
\ No newline at end of file
+    return _read_persona(path, path.stat().st_mtime)
+
+@lru_cache(maxsize=1)
+def _read_persona(path: Path, mtime: float) -> str:
+    """Read the persona file once per (path, mtime)"""
+    return path.read_text(encoding="utf-8").strip()
@@ -1,18 +1,68 @@
 """
 Cost calculation tool for project estimation
 """
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any
 import json
 from utils.config import PAYS_PATH, ENGINEERING_ROLES
 
+# Keyword tables and base estimates for hour estimation, built once at
+# import time
+_SIMPLE_KEYWORDS = frozenset({"simple", "basic", "quick", "minor"})
+_COMPLEX_KEYWORDS = frozenset({"complex", "advanced", "sophisticated", "comprehensive"})
+
+_TASK_ESTIMATES = {
+    "frontend": {
+        "simple": 8,
+        "medium": 16,
+        "complex": 32
+    },
+    "backend": {
+        "simple": 12,
+        "medium": 24,
+        "complex": 48
+    },
+    "database": {
+        "simple": 16,
+        "medium": 32,
+        "complex": 64
+    },
+    "cloud": {
+        "simple": 20,
+        "medium": 40,
+        "complex": 80
+    },
+    "testing": {
+        "simple": 8,
+        "medium": 16,
+        "complex": 24
+    }
+}
+
+# Checked in order; first keyword found in the role name wins
+_ROLE_TYPE_KEYWORDS = (
+    ("frontend", "frontend"),
+    ("backend", "backend"),
+    ("database", "database"),
+    ("cloud", "cloud"),
+    ("test", "testing")
+)
+
 def load_hourly_rates() -> Dict[str, float]:
     """
     Load hourly rates from pays.txt file of the engineering team
+    Rates are cached and re-read only when pays.txt changes on disk.
     """
+    mtime = PAYS_PATH.stat().st_mtime if PAYS_PATH.exists() else None
+    return _read_hourly_rates(mtime)
+
+@lru_cache(maxsize=1)
+def _read_hourly_rates(mtime) -> Dict[str, float]:
+    """Parse pays.txt once per mtime"""
     rates = {}
-    
-    if PAYS_PATH.exists():
+
+    if mtime is not None:
         try:
             with open(PAYS_PATH, 'r') as f:
                 for line in f:
@@ -64,17 +114,22 @@ def calculate_project_cost(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
     total_cost = 0
     total_hours = 0
     breakdown = []
-    
+    rates = load_hourly_rates()
+
     for task in tasks:
-        role = tasksummary.get("role", "")
+        role = task.get("role", "")
         hours = task.get("hours", 0)
-        
-        if role and hours > 0:
-            cost_info = calculate_task_cost(role, hours)
-            if "error" not in cost_info:
-                total_cost += cost_info["total_cost"]
-                total_hours += hours
-                breakdown.append(cost_info)
+
+        if role and hours > 0 and role in rates:
+            rate = rates[role]
+            total_cost += rate * hours
+            total_hours += hours
+            breakdown.append({
+                "role": role,
+                "hours": hours,
+                "rate": rate,
+                "total_cost": rate * hours
+            })
     
     return {
         "total_cost": total_cost,
@@ -92,60 +147,24 @@ def estimate_hours_from_description(description: str, role: str) -> float:
     This is a simplified estimation - in practice, this could be more sophisticated
     """
     description_lower = description.lower()
-    
-    # Base hours for different task types
-    task_estimates = {
-        "frontend": {
-            "simple": 8,
-            "medium": 16,
-            "complex": 32
-        },
-        "backend": {
-            "simple": 12,
-            "medium": 24,
-            "complex": 48
-        },
-        "database": {
-            "simple": 16,
-            "medium": 32,
-            "complex": 64
-        },
-        "cloud": {
-            "simple": 20,
-            "medium": 40,
-            "complex": 80
-        },
-        "testing": {
-            "simple": 8,
-            "medium": 16,
-            "complex": 24
-        }
-    }
-    
+
     # Determine complexity based on keywords
     complexity = "medium"  # default
-    
-    if any(word in description_lower for word in ["simple", "basic", "quick", "minor"]):
+
+    if any(word in description_lower for word in _SIMPLE_KEYWORDS):
         complexity = "simple"
-    elif any(word in description_lower for word in ["complex", "advanced", "sophisticated", "comprehensive"]):
+    elif any(word in description_lower for word in _COMPLEX_KEYWORDS):
         complexity = "complex"
-    
+
     # Determine role type
     role_lower = role.lower()
-    if "frontend" in role_lower:
-        role_type = "frontend"
-    elif "backend" in role_lower:
-        role_type = "backend"
-    elif "database" in role_lower:
-        role_type = "database"
-    elif "cloud" in role_lower:
-        role_type = "cloud"
-    elif "test" in role_lower:
-        role_type = "testing"
-    else:
-        role_type = "backend"  # default
-    
-    return task_estimates.get(role_type, {}).get(complexity, 16)
+    role_type = "backend"  # default
+    for keyword, candidate in _ROLE_TYPE_KEYWORDS:
+        if keyword in role_lower:
+            role_type = candidate
+            break
+
+    return _TASK_ESTIMATES.get(role_type, {}).get(complexity, 16)
 
 def get_available_roles() -> List[str]:
     """
@@ -7,14 +7,31 @@ from docx import Document
 import re
 from utils.config import QUESTIONER_PATH
 
-def extract_questioner_content() -> Dict[str, Any]:
+# Parsed document cache keyed by (path, mtime) so edits to the docx
+# invalidate it automatically
+_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# Keyword tables for categorizing sections, built once at import time
+_OVERVIEW_KEYWORDS = frozenset({"overview", "description", "summary"})
+_TECHNICAL_KEYWORDS = frozenset({"technical", "technology", "architecture", "system"})
+_FINANCIAL_KEYWORDS = frozenset({"financial", "budget", "cost", "pricing"})
+_TIMELINE_KEYWORDS = frozenset({"timeline", "schedule", "deadline", "milestone"})
+_RESOURCE_KEYWORDS = frozenset({"resource", "team", "staff", "personnel"})
+
+def extract_questioner_content(include_raw: bool = False) -> Dict[str, Any]:
     """
     Extract and parse content from the questioner.docx file
-    Returns structured data with sections and questions
+    Returns structured data with sections and questions; raw_text and the
+    preamble are only assembled when include_raw is set, since most
+    callers only need the sections
     """
     if not QUESTIONER_PATH.exists():
         return {"error": "Questioner document not found"}
-    
+
+    cache_key = (QUESTIONER_PATH, QUESTIONER_PATH.stat().st_mtime, include_raw)
+    if cache_key in _CACHE:
+        return _CACHE[cache_key]
+
     try:
         doc = Document(QUESTIONER_PATH)
         content = {
@@ -25,16 +42,27 @@ def extract_questioner_content() -> Dict[str, Any]:
         
         current_section = None
         current_questions = []
-        
+        raw_lines = []
+
+        # Pre-pass: pull (text, is_heading) out of the docx object tree in
+        # one sweep so classification below runs over plain tuples instead
+        # of re-examining paragraph objects
+        paragraphs = []
         for paragraph in doc.paragraphs:
             text = paragraph.text.strip()
             if not text:
                 continue
-                
-            content["raw_text"] += text + "\n"
-            
-            # Check if this is a section header (usually bold or larger font)
-            if paragraph.style.name.startswith('Heading') or paragraph.runs and paragraph.runs[0].bold:
+            # Section headers are usually a Heading style or bold text
+            style_name = paragraph.style.name
+            runs = paragraph.runs
+            is_heading = style_name.startswith('Heading') or bool(runs and runs[0].bold)
+            paragraphs.append((text, is_heading))
+
+        for text, is_heading in paragraphs:
+            if include_raw:
+                raw_lines.append(text)
+
+            if is_heading:
                 # Save previous section if exists
                 if current_section:
                     content["sections"].append({
@@ -48,7 +76,7 @@ def extract_questioner_content() -> Dict[str, Any]:
                 # This is likely a question or content
                 if current_section:
                     current_questions.append(text)
-                else:
+                elif include_raw:
                     # Content before first section
                     content["metadata"]["preamble"] = content["metadata"].get("preamble", "") + text + "\n"
         
@@ -58,9 +86,17 @@ def extract_questioner_content() -> Dict[str, Any]:
                 "title": current_section,
                 "questions": current_questions
             })
-        
+
+        if raw_lines:
+            content["raw_text"] = "\n".join(raw_lines) + "\n"
+
+        # Drop entries for older versions of the document, keeping the
+        # with- and without-raw variants of the current one
+        for stale_key in [key for key in _CACHE if key[:2] != cache_key[:2]]:
+            del _CACHE[stale_key]
+        _CACHE[cache_key] = content
         return content
-        
+
     except Exception as e:
         return {"error": f"Error extracting content: {str(e)}"}
 
@@ -108,15 +144,15 @@ def extract_project_requirements() -> Dict[str, Any]:
     for section in content["sections"]:
         title_lower = section["title"].lower()
         
-        if any(keyword in title_lower for keyword in ["overview", "description", "summary"]):
+        if any(keyword in title_lower for keyword in _OVERVIEW_KEYWORDS):
             requirements["project_overview"] = "\n".join(section["questions"])
-        elif any(keyword in title_lower for keyword in ["technical", "technology", "architecture", "system"]):
+        elif any(keyword in title_lower for keyword in _TECHNICAL_KEYWORDS):
             requirements["technical_requirements"].extend(section["questions"])
-        elif any(keyword in title_lower for keyword in ["financial", "budget", "cost", "pricing"]):
+        elif any(keyword in title_lower for keyword in _FINANCIAL_KEYWORDS):
             requirements["financial_requirements"].extend(section["questions"])
-        elif any(keyword in title_lower for keyword in ["timeline", "schedule", "deadline", "milestone"]):
+        elif any(keyword in title_lower for keyword in _TIMELINE_KEYWORDS):
             requirements["timeline_requirements"].extend(section["questions"])
-        elif any(keyword in title_lower for keyword in ["resource", "team", "staff", "personnel"]):
+        elif any(keyword in title_lower for keyword in _RESOURCE_KEYWORDS):
             requirements["resource_requirements"].extend(section["questions"])
     
     return requirements
@@ -129,13 +165,13 @@ def get_questioner_summary() -> str:
     if "error" in content:
         return "Error: Could not extract questioner content"
     
-    summary = "Questioner Document Structure:\n\n"
-    
+    parts = ["Questioner Document Structure:\n\n"]
+
     for i, section in enumerate(content["sections"], 1):
-        summary += f"{i}. {section['title']}\n"
-        summary += f"   Questions: {len(section['questions'])}\n"
+        parts.append(f"{i}. {section['title']}\n")
+        parts.append(f"   Questions: {len(section['questions'])}\n")
         if section['questions']:
-            summary += f"   Sample: {section['questions'][0][:100]}...\n"
-        summary += "\n"
-    
-    return summary 
\ No newline at end of file
+            parts.append(f"   Sample: {section['questions'][0][:100]}...\n")
+        parts.append("\n")
+
+    return "".join(parts)
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Response cache for the LLM agents
+Serves repeated prompts from disk instead of a fresh model round-trip
+"""
+import asyncio
+import hashlib
+import json
+import os
+from typing import Dict
+
+import anthropic
+import openai
+from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.messages import TextMessage
+from autogen_core import CancellationToken
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from utils.config import DATA_DIR
+from utils.file_utils import load_json, save_json
+
+CACHE_DIR = DATA_DIR / "llm_cache"
+
+# Caps how many model calls are in flight at once so concurrent report
+# generation doesn't burst past provider rate limits
+_LLM_SEMAPHORE = asyncio.Semaphore(int(os.getenv("LLM_MAX_CONCURRENCY", "8")))
+
+# Only these provider errors are worth retrying - rate limits, dropped
+# connections and 5xx. Auth and invalid-request errors fail fast instead
+# of burning backoff waits
+_TRANSIENT_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+)
+
+def _cache_key(key_fields: Dict[str, str]) -> str:
+    """Build a stable hash key from the fields that identify a call"""
+    payload = json.dumps(key_fields, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _cache_path(agent: AssistantAgent, content: str):
+    key = _cache_key({"agent": agent.name, "content": content})
+    return CACHE_DIR / f"{key}.json"
+
+def get_cached_response(agent: AssistantAgent, content: str):
+    """Return the cached response text for this agent/prompt, or None"""
+    cached = load_json(_cache_path(agent, content))
+    # An empty entry is treated as a miss so it can't pin a blank reply
+    return cached.get("response") or None
+
+def store_response(agent: AssistantAgent, content: str, response_text: str) -> None:
+    """Store a response text for this agent/prompt; empty responses
+    (e.g. from a tool-only turn) are never cached"""
+    if isinstance(response_text, str) and response_text.strip():
+        save_json({"response": response_text}, _cache_path(agent, content))
+
+@retry(
+    retry=retry_if_exception_type(_TRANSIENT_ERRORS),
+    wait=wait_exponential(multiplier=1, min=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+async def _call_model(agent: AssistantAgent, message: TextMessage):
+    """
+    Send a message to the agent with exponential backoff on transient
+    failures (429s, 5xx), holding a semaphore slot while in flight
+    """
+    async with _LLM_SEMAPHORE:
+        return await agent.on_messages([message], cancellation_token=CancellationToken())
+
+async def cached_call(agent: AssistantAgent, content: str) -> str:
+    """
+    Send content to the agent, short-circuiting to a cached response when
+    the same agent has already answered the exact same prompt.
+    The key is (agent name, prompt), so this is only safe for stateless
+    calls where the prompt carries everything the answer depends on -
+    the report generators, not the conversational chat agent.
+    Returns the response text.
+    """
+    cached = get_cached_response(agent, content)
+    if cached is not None:
+        return cached
+
+    message = TextMessage(content=content, source="user")
+    response = await _call_model(agent, message)
+    response_text = response.chat_message.content
+
+    store_response(agent, content, response_text)
+
+    return response_text
@@ -2,6 +2,8 @@
 Utility functions for file operations
 """
 import os
+import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, Any
 import json
@@ -28,17 +30,28 @@ def load_json(filepath: Path) -> Dict[str, Any]:
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
+# WordprocessingML namespace for reading document.xml directly
+_DOCX_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+def iter_docx_paragraphs(filepath: Path):
+    """Yield non-empty paragraph texts from a DOCX file one at a time"""
+    if not filepath.exists():
+        return
+
+    # Stream word/document.xml straight out of the archive instead of
+    # building the full python-docx object tree - we only need the text
+    with zipfile.ZipFile(filepath) as archive:
+        with archive.open("word/document.xml") as source:
+            for _, element in ET.iterparse(source):
+                if element.tag == f"{_DOCX_NS}p":
+                    para_text = ''.join(node.text or "" for node in element.iter(f"{_DOCX_NS}t")).strip()
+                    if para_text:
+                        yield para_text
+                    element.clear()
+
 def docx_to_text(filepath: Path) -> str:
     """Extract text from DOCX file"""
-    if not filepath.exists():
-        return ""
-    
-    doc = Document(filepath)
-    text = []
-    for paragraph in doc.paragraphs:
-        if paragraph.text.strip():
-            text.append(paragraph.text.strip())
-    return '\n'.join(text)
+    return '\n'.join(iter_docx_paragraphs(filepath))
 
 def create_docx_report(content: str, filepath: Path, title: str = "Report") -> None:
     """Create a DOCX report with formatted content"""
@@ -56,44 +69,40 @@ def create_docx_report(content: str, filepath: Path, title: str = "Report") -> N
     # Save the document
     doc.save(filepath)
 
+# PDF styles are shared across conversions, so build them once
+_PDF_STYLES = getSampleStyleSheet()
+_PDF_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_PDF_STYLES['Heading1'],
+    fontSize=16,
+    spaceAfter=30,
+    alignment=1  # Center
+)
+_PDF_CONTENT_STYLE = ParagraphStyle(
+    'Content',
+    parent=_PDF_STYLES['Normal'],
+    fontSize=11,
+    spaceAfter=6
+)
+
 def docx_to_pdf(docx_path: Path, pdf_path: Path) -> None:
     """Convert DOCX to PDF"""
     ensure_directory(pdf_path.parent)
-    
-    # Extract text from DOCX
-    text = docx_to_text(docx_path)
-    
+
     # Create PDF
     doc = SimpleDocTemplate(str(pdf_path), pagesize=letter)
-    styles = getSampleStyleSheet()
     story = []
-    
+
     # Add title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceAfter=30,
-        alignment=1  # Center
-    )
-    story.append(Paragraph("Project Report", title_style))
+    story.append(Paragraph("Project Report", _PDF_TITLE_STYLE))
     story.append(Spacer(1, 12))
-    
-    # Add content
-    content_style = ParagraphStyle(
-        'Content',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=6
-    )
-    
-    # Split content into paragraphs
-    paragraphs = text.split('\n')
-    for para in paragraphs:
-        if para.strip():
-            story.append(Paragraph(para, content_style))
-            story.append(Spacer(1, 6))
-    
+
+    # Add content, streaming paragraphs out of the DOCX instead of
+    # materializing the whole document text first
+    for para in iter_docx_paragraphs(docx_path):
+        story.append(Paragraph(para, _PDF_CONTENT_STYLE))
+        story.append(Spacer(1, 6))
+
     doc.build(story)
 
 def get_file_size(filepath: Path) -> str:
@@ -108,14 +117,27 @@ def get_file_size(filepath: Path) -> str:
         size /= 1024.0
     return f"{size:.1f} TB"
 
+def _scan_files(directory: Path):
+    """Yield DirEntry objects for all files under a directory"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
 def cleanup_old_files(directory: Path, max_age_days: int = 7) -> None:
     """Clean up old files in a directory"""
     import time
+    if not directory.is_dir():
+        return
+
     current_time = time.time()
     max_age_seconds = max_age_days * 24 * 60 * 60
-    
-    for filepath in directory.rglob("*"):
-        if filepath.is_file():
-            file_age = current_time - filepath.stat().st_mtime
-            if file_age > max_age_seconds:
-                filepath.unlink() 
\ No newline at end of file
+
+    # os.scandir caches file type and stat info on the DirEntry, so this
+    # avoids the extra stat per entry that rglob + is_file + stat incurs
+    for entry in _scan_files(directory):
+        file_age = current_time - entry.stat().st_mtime
+        if file_age > max_age_seconds:
+            os.unlink(entry.path) 
\ No newline at end of file